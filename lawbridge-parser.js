@@ -1,8 +1,65 @@
+const STX = 0x02; // Start of text
+const ETX = 0x03; // End of text
+
+// Shared empty buffer for "nothing pending"
+const EMPTY_BUFFER = Buffer.alloc(0);
+
+// Control characters that are not part of the transcript text
+const CONTROL_CHARS = /[\x00-\x08\x0B\x0C\x0E-\x1F]/g;
+
+// Number of data bytes for each command, indexed by command byte (-1 = unknown)
+const COMMAND_DATA_LENGTHS = new Int8Array(256).fill(-1);
+COMMAND_DATA_LENGTHS[0x50] = 2; // P - Page number
+COMMAND_DATA_LENGTHS[0x4E] = 1; // N - Line number
+COMMAND_DATA_LENGTHS[0x46] = 1; // F - Format
+COMMAND_DATA_LENGTHS[0x54] = 4; // T - Timecode
+COMMAND_DATA_LENGTHS[0x44] = 0; // D - Delete
+COMMAND_DATA_LENGTHS[0x4B] = 0; // K - Prevent saving
+COMMAND_DATA_LENGTHS[0x45] = 0; // E - End refresh
+COMMAND_DATA_LENGTHS[0x52] = 8; // R - Refresh
+
+// Longest possible command frame: STX + R + two timecodes + ETX
+const MAX_COMMAND_LENGTH = 11;
+
+// How far an unknown command may extend before its STX is treated as stray
+const MAX_UNKNOWN_COMMAND_LENGTH = 64;
+
+// Command letters built once, indexed by command byte
+const COMMAND_NAMES = Array.from({ length: 256 }, (_, code) => String.fromCharCode(code));
+
+// Format type names
+const FORMAT_NAMES = {
+  0x00: 'Fixed line',
+  0x01: 'Question',
+  0x02: 'Answer',
+  0x03: 'Speaker',
+  0x04: 'Question continuation',
+  0x05: 'Answer continuation',
+  0x06: 'Speaker continuation',
+  0x07: 'Parenthetical',
+  0x08: 'Centered',
+  0x09: 'Right-flush',
+  0x0A: 'By line',
+  0x0B: 'By line continuation'
+};
+
+// Describe a format code - named formats, anything else is user-defined
+function describeFormat(code) {
+  return FORMAT_NAMES[code] || `User-defined (0x${code.toString(16).padStart(2, '0')})`;
+}
+
+// Format descriptions built once for every format byte, indexed by format code
+const FORMAT_DESCRIPTIONS = Array.from({ length: 256 }, (_, code) => describeFormat(code));
+
+// Recently seen timecodes, keyed by their 4 raw bytes
+const TIMECODE_CACHE = new Map();
+const TIMECODE_CACHE_SIZE = 4096;
+
 class LawBridgeParser {
   constructor() {
-    this.STX = 0x02; // Start of text
-    this.ETX = 0x03; // End of text
-    this.buffer = Buffer.alloc(0);
+    this.STX = STX; // Start of text
+    this.ETX = ETX; // End of text
+    this.buffer = EMPTY_BUFFER;
     this.currentPage = 0;
     this.currentLine = 0;
     this.currentFormat = 0x00;
@@ -11,36 +68,68 @@ class LawBridgeParser {
     this.refreshStart = null;
     this.refreshEnd = null;
     this.refreshBuffer = [];
+
+    // Command handlers, indexed by command byte - built once
+    this.commandHandlers = {
+      0x50: this.handlePage.bind(this), // P
+      0x4E: this.handleLine.bind(this), // N
+      0x46: this.handleFormat.bind(this), // F
+      0x54: this.handleTimecode.bind(this), // T
+      0x44: this.handleDelete.bind(this), // D
+      0x4B: this.handlePreventSaving.bind(this), // K
+      0x45: this.handleRefreshEnd.bind(this), // E
+      0x52: this.handleRefreshStart.bind(this) // R
+    };
+
+    this.setRefreshMode(false);
   }
 
+  // Switch between realtime and refresh processing. The text buffering hook
+  // is swapped here so the text path never tests refreshMode
+  setRefreshMode(active) {
+    this.refreshMode = active;
+    this.bufferText = active ? this.bufferRefreshText : this.skipBufferText;
+  }
+
+  // Text outside a refresh is not buffered
+  skipBufferText() {}
+
   // Format type descriptions
   getFormatDescription(formatCode) {
-    const formats = {
-      0x00: 'Fixed line',
-      0x01: 'Question',
-      0x02: 'Answer',
-      0x03: 'Speaker',
-      0x04: 'Question continuation',
-      0x05: 'Answer continuation',
-      0x06: 'Speaker continuation',
-      0x07: 'Parenthetical',
-      0x08: 'Centered',
-      0x09: 'Right-flush',
-      0x0A: 'By line',
-      0x0B: 'By line continuation'
-    };
-    return formats[formatCode] || `User-defined (0x${formatCode.toString(16).padStart(2, '0')})`;
+    // Codes outside a single byte are described on the fly
+    return FORMAT_DESCRIPTIONS[formatCode] || describeFormat(formatCode);
   }
 
   // Parse timecode from 4 bytes
   parseTimecode(bytes) {
     if (bytes.length !== 4) return null;
-    return {
-      hours: bytes[0],
-      minutes: bytes[1],
-      seconds: bytes[2],
-      frames: bytes[3]
-    };
+    return this.readTimecode(bytes, 0);
+  }
+
+  // Read a timecode straight out of a frame - the caller guarantees 4 bytes.
+  // Timecodes repeat constantly, so one shared frozen object is kept per value
+  readTimecode(buffer, offset) {
+    // Plain index arithmetic so any byte array works, not just Buffers
+    const key = ((buffer[offset] << 24) | (buffer[offset + 1] << 16) |
+      (buffer[offset + 2] << 8) | buffer[offset + 3]) >>> 0;
+    let timecode = TIMECODE_CACHE.get(key);
+
+    if (!timecode) {
+      if (TIMECODE_CACHE.size >= TIMECODE_CACHE_SIZE) {
+        TIMECODE_CACHE.clear();
+      }
+
+      // Unpack the fields from the 32-bit key instead of indexing each byte again
+      timecode = Object.freeze({
+        hours: key >>> 24,
+        minutes: (key >>> 16) & 0xFF,
+        seconds: (key >>> 8) & 0xFF,
+        frames: key & 0xFF
+      });
+      TIMECODE_CACHE.set(key, timecode);
+    }
+
+    return timecode;
   }
 
   // Format timecode for display
@@ -53,69 +142,118 @@ class LawBridgeParser {
   // Add data to buffer and process immediately
   addData(data) {
     const results = [];
+    let i = 0;
 
-    // Process each byte immediately as it comes in
-    for (let i = 0; i < data.length; i++) {
-      const byte = data[i];
-
-      if (byte === this.STX) {
-        // Found start of command - add to buffer for command processing
-        this.buffer = Buffer.concat([this.buffer, Buffer.from([byte])]);
-      } else if (this.buffer.length > 0 && this.buffer[0] === this.STX) {
-        // We're in the middle of a command - add to buffer
-        this.buffer = Buffer.concat([this.buffer, Buffer.from([byte])]);
+    // Finish a command that was split across reads, joining only the bytes
+    // it can still need instead of copying the whole new chunk behind it.
+    // Unknown commands are decided within MAX_UNKNOWN_COMMAND_LENGTH bytes,
+    // so a head that long is always enough
+    if (this.buffer.length > 0) {
+      const pending = this.buffer;
+      const head = Buffer.concat([pending, data.subarray(0, MAX_UNKNOWN_COMMAND_LENGTH)]);
+      const commandResult = this.processCommand(0, head);
+      const consumed = commandResult.bytesConsumed;
+      this.buffer = EMPTY_BUFFER;
+
+      if (consumed === 0 && data.length <= MAX_UNKNOWN_COMMAND_LENGTH) {
+        // Still incomplete - head already holds everything received so far
+        this.buffer = head;
+        return results;
+      }
 
-        // Try to process the command if we might have enough data
-        const commandResults = this.tryProcessCommand();
-        results.push(...commandResults);
+      if (consumed > 0 && consumed >= pending.length) {
+        this.addCommandResult(commandResult, results);
+        i = consumed - pending.length;
       } else {
-        // Regular text character - emit immediately
-        const char = String.fromCharCode(byte);
+        // Unknown command left part of the pending bytes - rescan them
+        // together with the new data
+        data = Buffer.concat([pending, data]);
+        i = consumed;
+      }
+    }
 
-        if (char && char.charCodeAt(0) >= 32 || char === '\r' || char === '\n' || char === '\t') {
-          // Emit this character immediately
-          const textData = {
-            type: 'text',
-            content: char,
-            page: this.currentPage,
-            line: this.currentLine,
-            format: this.currentFormat,
-            formatDescription: this.getFormatDescription(this.currentFormat),
-            timecode: this.currentTimecode
-          };
+    const length = data.length;
 
-          results.push(textData);
+    while (i < length) {
+      // Everything up to the next STX is plain text - emit it as one run
+      const stx = data.indexOf(STX, i);
+      const textEnd = stx === -1 ? length : stx;
 
-          // If in refresh mode, also buffer this text
-          if (this.refreshMode) {
-            this.refreshBuffer.push({...textData});
-          }
-        }
+      if (textEnd > i) {
+        this.emitText(data.toString('latin1', i, textEnd), results);
       }
+
+      if (stx === -1) break;
+
+      // Jump straight over the whole command frame
+      const commandResult = this.processCommand(stx, data);
+      if (commandResult.bytesConsumed === 0) {
+        // Incomplete command - keep it until the rest arrives
+        this.buffer = data.slice(stx);
+        break;
+      }
+
+      this.addCommandResult(commandResult, results);
+      i = stx + commandResult.bytesConsumed;
     }
 
     return results;
   }
 
-  // Try to process command from buffer
-  tryProcessCommand() {
-    if (this.buffer.length < 3) return []; // Need at least STX + command + ETX
-
-    const commandResult = this.processCommand(0);
-    if (commandResult.commandData && commandResult.bytesConsumed > 0) {
-      // Remove the processed command from buffer
-      this.buffer = this.buffer.slice(commandResult.bytesConsumed);
+  // Process several reads in one call - joined up front so they are scanned once
+  addChunks(chunks) {
+    return this.addData(Buffer.concat(chunks));
+  }
 
-      return [{
+  // Add a processed command to the results
+  addCommandResult(commandResult, results) {
+    if (commandResult.commandData) {
+      results.push({
         type: 'command',
         command: commandResult.command,
         data: commandResult.commandData,
         page: this.currentPage,
         line: this.currentLine
-      }];
+      });
     }
+  }
 
-    return [];
+  // Emit a run of text characters as a single result
+  emitText(text, results) {
+    // Drop control characters other than CR, LF and tab
+    const content = text.replace(CONTROL_CHARS, '');
+    if (!content) return;
+
+    const textData = {
+      type: 'text',
+      content: content,
+      page: this.currentPage,
+      line: this.currentLine,
+      format: this.currentFormat,
+      formatDescription: this.getFormatDescription(this.currentFormat),
+      timecode: this.currentTimecode
+    };
+
+    results.push(textData);
+
+    // If in refresh mode, also buffer this text
+    this.bufferText(textData);
+  }
+
+  // Append text to the refresh buffer, growing the last entry while the
+  // page, line, format and timecode stay the same
+  bufferRefreshText(textData) {
+    const last = this.refreshBuffer[this.refreshBuffer.length - 1];
+    if (last && last.type === 'text' &&
+        last.page === textData.page &&
+        last.line === textData.line &&
+        last.format === textData.format &&
+        last.timecode === textData.timecode) {
+      last.content += textData.content;
+      return;
+    }
+
+    this.refreshBuffer.push({...textData});
   }
 
   // Process buffered data and extract commands
@@ -126,7 +264,7 @@ class LawBridgeParser {
     let i = 0;
     while (i < this.buffer.length) {
       // Check if we're at the start of a command (STX)
-      if (this.buffer[i] === this.STX) {
+      if (this.buffer[i] === STX) {
         // Emit any accumulated text before processing the command
         if (textAccumulator) {
           const textData = {
@@ -142,9 +280,7 @@ class LawBridgeParser {
           results.push(textData);
 
           // If in refresh mode, also buffer this text
-          if (this.refreshMode) {
-            this.refreshBuffer.push({...textData});
-          }
+          this.bufferText(textData);
 
           textAccumulator = '';
         }
@@ -178,9 +314,11 @@ class LawBridgeParser {
           i++; // Skip this STX and continue
         }
       } else {
-        // Regular character - add to text accumulator
-        textAccumulator += String.fromCharCode(this.buffer[i]);
-        i++;
+        // Regular text - add the whole run up to the next STX in one slice
+        const next = this.buffer.indexOf(STX, i);
+        const end = next === -1 ? this.buffer.length : next;
+        textAccumulator += this.buffer.toString('latin1', i, end);
+        i = end;
       }
     }
 
@@ -199,143 +337,156 @@ class LawBridgeParser {
       results.push(textData);
 
       // If in refresh mode, also buffer this text
-      if (this.refreshMode) {
-        this.refreshBuffer.push({...textData});
-      }
+      this.bufferText(textData);
     }
 
     // Clear the buffer as we've processed everything
-    this.buffer = Buffer.alloc(0);
+    this.buffer = EMPTY_BUFFER;
 
     return results;
   }
 
   // Process a single command starting at the given index
-  processCommand(startIndex) {
+  processCommand(startIndex, buffer = this.buffer) {
     // Check if we have enough data for a command
-    if (startIndex + 2 >= this.buffer.length) {
+    if (startIndex + 2 >= buffer.length) {
       return { command: null, commandData: null, bytesConsumed: 0 };
     }
 
-    const command = String.fromCharCode(this.buffer[startIndex + 1]);
-    let commandLength = 3; // Default: STX + command + ETX
-    let commandData = null;
-
-    // Determine command length and extract data based on command type
-    switch (command) {
-      case 'P': // Page number (2 bytes)
-        if (startIndex + 4 >= this.buffer.length) return { command, commandData: null, bytesConsumed: 0 };
-        commandLength = 5;
-        if (this.buffer[startIndex + 4] === this.ETX) {
-          const pageNum = this.buffer.readUInt16LE(startIndex + 2);
-          this.currentPage = pageNum;
-          commandData = { pageNumber: pageNum };
-        }
-        break;
+    // Look up the command by its raw byte - no per-frame string building
+    const code = buffer[startIndex + 1];
+    const command = COMMAND_NAMES[code];
+    const dataLength = COMMAND_DATA_LENGTHS[code];
+
+    if (dataLength === -1) {
+      // Unknown command - its length is unknown, so skip straight past its ETX,
+      // or up to the next STX if another command starts first. Only look a
+      // bounded distance ahead so a stray STX can't hold back the stream
+      const windowEnd = Math.min(buffer.length, startIndex + MAX_UNKNOWN_COMMAND_LENGTH);
+      const window = buffer.subarray(0, windowEnd);
+      const etx = window.indexOf(ETX, startIndex + 1);
+      const stx = window.indexOf(STX, startIndex + 1);
+
+      if (stx !== -1 && (etx === -1 || stx < etx)) {
+        return { command, commandData: null, bytesConsumed: stx - startIndex };
+      }
 
-      case 'N': // Line number (1 byte)
-        if (startIndex + 3 >= this.buffer.length) return { command, commandData: null, bytesConsumed: 0 };
-        commandLength = 4;
-        if (this.buffer[startIndex + 3] === this.ETX) {
-          const lineNum = this.buffer[startIndex + 2];
-          this.currentLine = lineNum;
-          commandData = { lineNumber: lineNum };
-        }
-        break;
+      if (etx !== -1) {
+        return { command, commandData: null, bytesConsumed: etx - startIndex + 1 };
+      }
 
-      case 'F': // Format (1 byte)
-        if (startIndex + 3 >= this.buffer.length) return { command, commandData: null, bytesConsumed: 0 };
-        commandLength = 4;
-        if (this.buffer[startIndex + 3] === this.ETX) {
-          const format = this.buffer[startIndex + 2];
-          this.currentFormat = format;
-          commandData = {
-            format: format,
-            formatDescription: this.getFormatDescription(format)
-          };
-        }
-        break;
+      if (windowEnd - startIndex < MAX_UNKNOWN_COMMAND_LENGTH) {
+        // The terminator may still arrive within the window
+        return { command, commandData: null, bytesConsumed: 0 };
+      }
 
-      case 'T': // Timecode (4 bytes)
-        if (startIndex + 6 >= this.buffer.length) return { command, commandData: null, bytesConsumed: 0 };
-        commandLength = 7;
-        if (this.buffer[startIndex + 6] === this.ETX) {
-          const timecodeBytes = this.buffer.slice(startIndex + 2, startIndex + 6);
-          const timecode = this.parseTimecode(timecodeBytes);
-          this.currentTimecode = timecode;
-          commandData = {
-            timecode: timecode,
-            timecodeString: this.formatTimecode(timecode)
-          };
-        }
-        break;
+      // No terminator within reach - drop just the STX
+      return { command, commandData: null, bytesConsumed: 1 };
+    }
 
-      case 'D': // Delete (no data)
-        if (this.buffer[startIndex + 2] === this.ETX) {
-          commandData = { action: 'delete' };
-        }
-        break;
+    const commandLength = dataLength + 3; // STX + command + data + ETX
+    if (startIndex + commandLength > buffer.length) {
+      return { command, commandData: null, bytesConsumed: 0 };
+    }
 
-      case 'K': // Prevent saving (no data)
-        if (this.buffer[startIndex + 2] === this.ETX) {
-          commandData = { action: 'preventSaving' };
-        }
-        break;
+    // The ETX must sit exactly after the data, otherwise skip the frame
+    if (buffer[startIndex + commandLength - 1] !== ETX) {
+      return { command, commandData: null, bytesConsumed: commandLength };
+    }
 
-      case 'E': // End refresh (no data)
-        if (this.buffer[startIndex + 2] === this.ETX) {
-          this.refreshMode = false;
-          commandData = {
-            action: 'endRefresh',
-            refreshStart: this.refreshStart,
-            refreshEnd: this.refreshEnd,
-            refreshData: [...this.refreshBuffer]
-          };
-          this.refreshBuffer = [];
-          this.refreshStart = null;
-          this.refreshEnd = null;
-        }
-        break;
+    // Hand the data straight to the command's handler
+    const commandData = this.commandHandlers[code](buffer, startIndex + 2);
 
-      case 'R': // Refresh (8 bytes: start and end timecodes)
-        if (startIndex + 10 >= this.buffer.length) return { command, commandData: null, bytesConsumed: 0 };
-        commandLength = 11;
-        if (this.buffer[startIndex + 10] === this.ETX) {
-          const startBytes = this.buffer.slice(startIndex + 2, startIndex + 6);
-          const endBytes = this.buffer.slice(startIndex + 6, startIndex + 10);
-          this.refreshStart = this.parseTimecode(startBytes);
-          this.refreshEnd = this.parseTimecode(endBytes);
-          this.refreshMode = true;
-          this.refreshBuffer = [];
-          commandData = {
-            action: 'refresh',
-            startTimecode: this.refreshStart,
-            endTimecode: this.refreshEnd,
-            startTimecodeString: this.formatTimecode(this.refreshStart),
-            endTimecodeString: this.formatTimecode(this.refreshEnd)
-          };
-        }
-        break;
+    return { command, commandData, bytesConsumed: commandLength };
+  }
 
-      default:
-        // Unknown command, return minimal consumption
-        return { command, commandData: null, bytesConsumed: 1 };
-    }
+  // P - Page number (2 bytes, little-endian)
+  handlePage(buffer, dataStart) {
+    const pageNum = buffer.readUInt16LE(dataStart);
+    this.currentPage = pageNum;
+    return { pageNumber: pageNum };
+  }
 
-    return { command, commandData, bytesConsumed: commandLength };
+  // N - Line number (1 byte)
+  handleLine(buffer, dataStart) {
+    const lineNum = buffer[dataStart];
+    this.currentLine = lineNum;
+    return { lineNumber: lineNum };
+  }
+
+  // F - Format (1 byte)
+  handleFormat(buffer, dataStart) {
+    const format = buffer[dataStart];
+    this.currentFormat = format;
+    return {
+      format: format,
+      formatDescription: this.getFormatDescription(format)
+    };
+  }
+
+  // T - Timecode (4 bytes)
+  handleTimecode(buffer, dataStart) {
+    const timecode = this.readTimecode(buffer, dataStart);
+    this.currentTimecode = timecode;
+    return {
+      timecode: timecode,
+      timecodeString: this.formatTimecode(timecode)
+    };
+  }
+
+  // D - Delete (no data)
+  handleDelete() {
+    return { action: 'delete' };
+  }
+
+  // K - Prevent saving (no data)
+  handlePreventSaving() {
+    return { action: 'preventSaving' };
+  }
+
+  // E - End refresh (no data)
+  handleRefreshEnd() {
+    this.setRefreshMode(false);
+    const commandData = {
+      action: 'endRefresh',
+      refreshStart: this.refreshStart,
+      refreshEnd: this.refreshEnd,
+      // Hand the buffered entries over as-is instead of copying them -
+      // the result keeps this array, so the parser starts a new one
+      refreshData: this.refreshBuffer
+    };
+    this.refreshBuffer = [];
+    this.refreshStart = null;
+    this.refreshEnd = null;
+    return commandData;
+  }
+
+  // R - Refresh (8 bytes: start and end timecodes)
+  handleRefreshStart(buffer, dataStart) {
+    this.refreshStart = this.readTimecode(buffer, dataStart);
+    this.refreshEnd = this.readTimecode(buffer, dataStart + 4);
+    this.setRefreshMode(true);
+    this.refreshBuffer = [];
+    return {
+      action: 'refresh',
+      startTimecode: this.refreshStart,
+      endTimecode: this.refreshEnd,
+      startTimecodeString: this.formatTimecode(this.refreshStart),
+      endTimecodeString: this.formatTimecode(this.refreshEnd)
+    };
   }
 
   // Reset parser state
   reset() {
-    this.buffer = Buffer.alloc(0);
+    this.buffer = EMPTY_BUFFER;
     this.currentPage = 0;
     this.currentLine = 0;
     this.currentFormat = 0x00;
     this.currentTimecode = null;
-    this.refreshMode = false;
     this.refreshStart = null;
     this.refreshEnd = null;
     this.refreshBuffer = [];
+    this.setRefreshMode(false);
   }
 
   // Get current state
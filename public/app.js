@@ -278,7 +278,7 @@ class BridgeViewer {
     }
 
     handleBridgeData(data) {
-        this.transcriptData.push(data);
+        this.appendToTranscript(data);
         this.updateItemCount();
         this.updateLastUpdate();
 
@@ -300,27 +300,52 @@ class BridgeViewer {
         // Only display text content, not control commands
         // Commands like P, N, F, T, D, K, R, E should be processed silently
         if (data.type === 'text' && !this.refreshInProgress) {
-            // Handle character-by-character text for real-time display
+            // Handle streamed text runs for real-time display
             this.handleRealTimeText(data);
         }
         // Commands are processed silently - they update state but don't appear in transcript
     }
 
-    handleRealTimeText(data) {
-        const char = data.content;
-
-        // Eclipse doesn't use CR/LF for line breaks - it uses N and F commands!
-        // CR/LF characters are just protocol artifacts, so treat them as whitespace or ignore them
-        if (char === '\r' || char === '\n') {
-            // Convert line feed characters to spaces to preserve word separation
-            // Don't create line breaks here - that's handled by N and F commands
-            this.textAccumulator += ' ';
-            this.updateRealTimeDisplay();
+    appendToTranscript(data) {
+        // Text streams in as many small runs - grow the previous text item in place
+        // instead of storing one item per run, as long as nothing else changed
+        const last = this.transcriptData[this.transcriptData.length - 1];
+        if (data.type === 'text' && this.isSameTextRun(last, data)) {
+            last.content += data.content;
             return;
         }
 
-        // Accumulate the character normally
-        this.textAccumulator += char;
+        this.transcriptData.push(data);
+    }
+
+    isSameTextRun(item1, item2) {
+        // Runs belong together if they share the same session, position, format and timecode
+        return item1 && item2 &&
+               item1.type === 'text' && item2.type === 'text' &&
+               item1.sessionId === item2.sessionId &&
+               item1.page === item2.page &&
+               item1.line === item2.line &&
+               item1.format === item2.format &&
+               this.isSameTimecode(item1.timecode, item2.timecode);
+    }
+
+    isSameTimecode(timecode1, timecode2) {
+        if (!timecode1 || !timecode2) return timecode1 === timecode2;
+        return timecode1.hours === timecode2.hours &&
+               timecode1.minutes === timecode2.minutes &&
+               timecode1.seconds === timecode2.seconds &&
+               timecode1.frames === timecode2.frames;
+    }
+
+    handleRealTimeText(data) {
+        // Text arrives as whole runs of characters between commands
+        // Eclipse doesn't use CR/LF for line breaks - it uses N and F commands!
+        // CR/LF characters are just protocol artifacts, so convert them to spaces
+        // to preserve word separation - line breaks are handled by N and F commands
+        const text = data.content.replace(/[\r\n]/g, ' ');
+
+        // Accumulate the whole run at once
+        this.textAccumulator += text;
 
         // Update the display immediately
         this.updateRealTimeDisplay();
@@ -1034,10 +1059,10 @@ class BridgeViewer {
                     return newItem;
                 });
 
-                console.log(`EXECUTING SPLICE: transcriptData.splice(${replaceInfo.startIndex}, ${replaceInfo.count}, ...${newItems.length} items)`);
+                console.log(`EXECUTING REPLACE: ${replaceInfo.count} items at ${replaceInfo.startIndex} with ${newItems.length} items`);
 
                 // Replace the items at the exact location
-                this.transcriptData.splice(replaceInfo.startIndex, replaceInfo.count, ...newItems);
+                this.replaceTranscriptRange(replaceInfo.startIndex, replaceInfo.count, newItems);
 
                 console.log(`NEW TRANSCRIPT LENGTH: ${this.transcriptData.length} items`);
 
@@ -1071,42 +1096,66 @@ class BridgeViewer {
         this.refreshEndTime = null;
     }
 
+    replaceTranscriptRange(startIndex, count, items) {
+        // Replace in a single pass: move the tail once to where it ends up, then
+        // copy the new items into the gap. Unlike splice(start, count, ...items)
+        // this never passes every item as a call argument
+        const data = this.transcriptData;
+        const oldLength = data.length;
+        const tailStart = startIndex + count;
+        const shift = items.length - count;
+
+        if (shift > 0) {
+            for (let i = 0; i < shift; i++) data.push(null);
+            data.copyWithin(tailStart + shift, tailStart, oldLength);
+        } else if (shift < 0) {
+            data.copyWithin(tailStart + shift, tailStart, oldLength);
+            data.length = oldLength + shift;
+        }
+
+        for (let i = 0; i < items.length; i++) {
+            data[startIndex + i] = items[i];
+        }
+    }
+
     findItemsToReplace(startTime, endTime) {
         console.log('Finding items to replace between EXACT timecodes:', this.formatTimecode(startTime), 'and', this.formatTimecode(endTime));
 
-        const startSeconds = this.timecodeToSeconds(startTime);
-        const endSeconds = this.timecodeToSeconds(endTime);
+        const startFrames = this.timecodeToFrames(startTime);
+        const endFrames = this.timecodeToFrames(endTime);
 
         let startIndex = -1;
         let endIndex = -1;
 
-        console.log(`Looking for items between ${startSeconds} and ${endSeconds} seconds`);
+        console.log(`Looking for items between ${startFrames} and ${endFrames} frames`);
 
-        // Find EXACT range based on timecodes - no tolerance
-        for (let i = 0; i < this.transcriptData.length; i++) {
-            const item = this.transcriptData[i];
+        // Find EXACT range based on timecodes - no tolerance. Timecodes are compared
+        // as whole frames, and the scan stops at the first item past the end time
+        const data = this.transcriptData;
+        for (let i = 0; i < data.length; i++) {
+            const item = data[i];
+            if (!item.timecode) continue;
 
-            if (item.timecode) {
-                const itemSeconds = this.timecodeToSeconds(item.timecode);
-                console.log(`Item ${i}: ${itemSeconds} seconds - "${item.content?.substring(0, 30) || 'N/A'}"`);
+            const itemFrames = this.timecodeToFrames(item.timecode);
 
-                // Find first item at or after start time
-                if (startIndex === -1 && itemSeconds >= startSeconds) {
-                    startIndex = i;
-                    console.log(`Found start index: ${i} at ${itemSeconds} seconds`);
-                }
+            // Find first item at or after start time
+            if (startIndex === -1 && itemFrames >= startFrames) {
+                startIndex = i;
+            }
 
-                // Find last item at or before end time
-                if (itemSeconds <= endSeconds) {
-                    endIndex = i;
-                    console.log(`Updated end index to: ${i} at ${itemSeconds} seconds`);
-                } else if (startIndex !== -1) {
-                    // We've gone past the end time
-                    break;
-                }
+            // Find last item at or before end time
+            if (itemFrames <= endFrames) {
+                endIndex = i;
+            } else if (startIndex !== -1) {
+                // We've gone past the end time
+                break;
             }
         }
 
+        if (startIndex !== -1) {
+            console.log(`Found start index: ${startIndex}, end index: ${endIndex}`);
+        }
+
         if (startIndex !== -1 && endIndex !== -1 && endIndex >= startIndex) {
             const count = endIndex - startIndex + 1;
             console.log(`EXACT MATCH: Will replace ${count} items from index ${startIndex} to ${endIndex}`);
@@ -1179,6 +1228,12 @@ class BridgeViewer {
         };
     }
 
+    timecodeToFrames(timecode) {
+        // Whole frames (30ths of a second) - integer keys compare exactly and cheaply
+        if (!timecode) return 0;
+        return ((timecode.hours * 60 + timecode.minutes) * 60 + timecode.seconds) * 30 + timecode.frames;
+    }
+
     timecodeToSeconds(timecode) {
         if (!timecode) return 0;
         return (timecode.hours * 3600) + (timecode.minutes * 60) + timecode.seconds + (timecode.frames / 30);